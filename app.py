@@ -1,6 +1,11 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+_APP_DIR: Final[Path] = Path(__file__).resolve().parent
 
 # -------------------------------
 # Page config
@@ -40,6 +45,7 @@ st.write("")  # spacer
 # -------------------------------
 # Helpers
 # -------------------------------
+@st.cache_data(max_entries=512, show_spinner=False)
 def compute_roi(annual_ops_cost: float,
                 labor_share: float,
                 manpower_reduction: float,
@@ -82,19 +88,203 @@ def compute_roi(annual_ops_cost: float,
     return results
 
 
+def compute_roi_vec(annual_ops_cost: float,
+                    labor_share: float,
+                    manpower_reduction_arr,
+                    productivity_gain_arr,
+                    platform_cost: float):
+    """
+    Vectorized form of compute_roi for the sensitivity sweep.
+    Either lever may be an array; scalars broadcast against it.
+    Returns a dict of NumPy arrays (one pass, no per-row dicts).
+    """
+    manpower_reduction_arr, productivity_gain_arr = np.broadcast_arrays(
+        np.asarray(manpower_reduction_arr, dtype=float),
+        np.asarray(productivity_gain_arr, dtype=float)
+    )
+    labor_cost = annual_ops_cost * labor_share
+
+    savings = labor_cost * manpower_reduction_arr - platform_cost
+    roi = savings / platform_cost if platform_cost else np.zeros_like(savings)
+    # Same guards as compute_roi without a Python branch: floor savings at 1,
+    # and report 0 payback when there is no platform cost
+    payback = np.where(platform_cost > 0, 12.0 * platform_cost / np.maximum(savings, 1.0), 0.0)
+
+    return {
+        "Savings": savings,
+        "ROI (Savings / Platform)": roi,
+        "Payback (months)": payback,
+        "Throughput multiplier (1+prod)": 1 + productivity_gain_arr
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def all_sweeps(annual_ops_cost: float,
+               labor_share: float,
+               manpower_reduction: float,
+               productivity_gain: float,
+               platform_cost: float,
+               steps: int):
+    """
+    Both sensitivity sweeps in one compute_roi_vec call over a 2-D grid:
+    row 0 sweeps manpower reduction, row 1 sweeps productivity gain (0-40%).
+    Returns one chart-ready DataFrame per lever, so toggling the lever is a lookup.
+    """
+    xs = np.linspace(0.0, 0.40, steps)
+    fixed_mcut = np.full(steps, manpower_reduction, dtype=float)
+    fixed_pg = np.full(steps, productivity_gain, dtype=float)
+    grid = compute_roi_vec(
+        annual_ops_cost, labor_share,
+        np.stack([xs, fixed_mcut]), np.stack([fixed_pg, xs]),
+        platform_cost
+    )
+
+    sweeps = {}
+    for row, (lever, label) in enumerate([("Manpower reduction (%)", "Manpower cut"),
+                                          ("Productivity gain (%)", "Productivity gain")]):
+        sweeps[lever] = pd.DataFrame(
+            {
+                "Savings": grid["Savings"][row],
+                "ROI (Savings / Platform)": grid["ROI (Savings / Platform)"][row],
+                "Payback (months)": grid["Payback (months)"][row]
+            },
+            index=pd.Index(xs, name=label)
+        )
+    return sweeps
+
+
+@st.cache_data(show_spinner=False)
+def results_table(items: tuple) -> dict:
+    """Headline metrics as pre-formatted strings for the results table (no DataFrame needed)."""
+    results = dict(items)
+    return {
+        "Metric": [
+            "Baseline cost",
+            "New cost",
+            "Savings",
+            "Platform cost",
+            "ROI (Savings / Platform)",
+            "Payback (months)"
+        ],
+        "Value": [
+            f"${results['Baseline cost']:,.0f}",
+            f"${results['New cost']:,.0f}",
+            f"${results['Savings']:,.0f}",
+            f"${results['Platform cost']:,.0f}",
+            f"{results['ROI (Savings / Platform)']:.2f}",
+            f"{results['Payback (months)']:.1f}"
+        ]
+    }
+
+
+@st.cache_data(show_spinner=False)
+def results_csv(items: tuple) -> bytes:
+    """One-row CSV (header + values) for the download button, built without pandas."""
+    keys, values = zip(*items)
+    return (",".join(keys) + "\n" + ",".join(map(str, values)) + "\n").encode("utf-8")
+
+
+_THEORY_FILES: Final[tuple] = (
+    "theory-to-case/value-proposition-map.md",
+    "theory-to-case/strategic-challenges-map.md",
+    "theory-to-case/frameworks.md"
+)
+_MISSING_MSG: Final[str] = "> ⚠️ Could not find `{}`. Make sure your repo contains this file."
+
+
+@st.cache_resource(show_spinner=False)
+def _load_theory() -> MappingProxyType:
+    """Read the shipped theory files once per server process into a read-only mapping."""
+    theory = {}
+    for name in _THEORY_FILES:
+        try:
+            theory[name] = (_APP_DIR / name).read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            pass
+    return MappingProxyType(theory)
+
+
 def load_markdown(relative_path: str) -> str:
-    """Safely load a local markdown file if it exists; otherwise return a helpful note."""
-    p = Path(__file__).parent / relative_path
-    if p.exists():
-        return p.read_text(encoding="utf-8")
-    return f"> ⚠️ Could not find `{relative_path}`. Make sure your repo contains this file."
+    """Return a preloaded theory file; otherwise a helpful note."""
+    return _THEORY.get(relative_path, _MISSING_MSG.format(relative_path))
+
+
+# Theory and About are wrapped as fragments. They contain no widgets and the page
+# has no other fragments, so today this changes nothing; it only pays off if
+# widgets or other fragments are added later.
+@st.fragment
+def _render_theory():
+    st.subheader("Theory ↔ Case Mapping")
+
+    st.markdown("##### Value Proposition Map")
+    st.markdown(load_markdown("theory-to-case/value-proposition-map.md"))
+
+    st.markdown("---")
+    st.markdown("##### Strategic Challenges Map")
+    st.markdown(load_markdown("theory-to-case/strategic-challenges-map.md"))
+
+    st.markdown("---")
+    st.markdown("##### Frameworks Applied")
+    st.markdown(load_markdown("theory-to-case/frameworks.md"))
+
+
+@st.fragment
+def _render_about():
+    st.subheader("About this companion")
+
+    st.markdown(st.session_state.about_html)
+
+    st.markdown("---")
+    st.write("If you have our deck or GitHub link, you can jump between slides, this app, and the theory files for full transparency.")
+
+# -------------------------------
+# Static content
+# -------------------------------
+_THEORY = _load_theory()
 
+_ABOUT_MD: Final[str] = """
+**Course:** Technology & Digitization of Supply Chains  
+**School:** SP Jain School of Global Management  
+**Team:** Group 4 — Sanchit, Midhun, Venarose, Dhruv
 
-def format_money(x: float) -> str:
-    try:
-        return f"${x:,.0f}"
-    except Exception:
-        return str(x)
+**What this app demonstrates**
+- We operationalize the case narrative into a quantitative sandbox.
+- We connect slide claims to academic frameworks and page-anchored evidence.
+- We make the value-proposition shift (from guard-hours to outcomes) measurable.
+"""
+
+# Stash the About text per session. _ABOUT_MD is still rebuilt and the markdown
+# element re-sent on every rerun; the only effect is that sessions already open
+# keep showing the old text after _ABOUT_MD is edited.
+if "about_html" not in st.session_state:
+    st.session_state.about_html = _ABOUT_MD
+
+# -------------------------------
+# Presets (seed the keyed sidebar widgets via session_state)
+# -------------------------------
+_PRESETS = {
+    "Mall / Jewel-ish": {
+        "labor_share": 0.80,
+        "manpower_reduction": 0.20,
+        "productivity_gain": 0.25,
+        "platform_cost": 600_000
+    },
+    "Precinct / JTC-ish": {
+        "labor_share": 0.78,
+        "manpower_reduction": 0.18,
+        "productivity_gain": 0.25,
+        "platform_cost": 750_000
+    }
+}
+
+# First run: the widget defaults are the case-narrative (Mall) numbers
+for _key, _value in _PRESETS["Mall / Jewel-ish"].items():
+    st.session_state.setdefault(_key, _value)
+
+
+def _apply_preset(name: str):
+    """Button callback: runs before the rerun, so the sliders move to the preset values."""
+    st.session_state.update(_PRESETS[name])
 
 # -------------------------------
 # Sidebar (shared inputs)
@@ -105,88 +295,81 @@ with st.sidebar:
     st.caption("Defaults mirror the case narrative: labor ~80% of cost, ~20% manpower reduction, "
                "~25% productivity gain, platform cost ≈ $600k.")
 
-    annual_ops_cost = st.number_input(
-        "Baseline annual ops cost ($)",
-        min_value=500_000,
-        step=100_000,
-        value=5_000_000
-    )
-    labor_share = st.slider("Labor share of ops cost", 0.30, 0.95, 0.80)
-    manpower_reduction = st.slider("Manpower reduction (%)", 0.00, 0.50, 0.20)
-    productivity_gain = st.slider("Productivity gain (%)", 0.00, 0.40, 0.25)
-    platform_cost = st.number_input(
-        "Annual platform + change mgmt cost ($)",
-        min_value=100_000,
-        step=50_000,
-        value=600_000
-    )
+    # Batch the inputs in a form so dragging a slider doesn't rerun the model
+    # on every intermediate value; everything recomputes once on Apply.
+    with st.form("inputs"):
+        annual_ops_cost = st.number_input(
+            "Baseline annual ops cost ($)",
+            min_value=500_000,
+            step=100_000,
+            value=5_000_000
+        )
+        labor_share = st.slider("Labor share of ops cost", 0.30, 0.95, key="labor_share")
+        manpower_reduction = st.slider("Manpower reduction (%)", 0.00, 0.50, key="manpower_reduction")
+        productivity_gain = st.slider("Productivity gain (%)", 0.00, 0.40, key="productivity_gain")
+        platform_cost = st.number_input(
+            "Annual platform + change mgmt cost ($)",
+            min_value=100_000,
+            step=50_000,
+            key="platform_cost"
+        )
+        st.form_submit_button("Apply")
 
     st.markdown("---")
     st.subheader("Quick presets")
     col_p1, col_p2 = st.columns(2)
     with col_p1:
-        if st.button("Mall / Jewel-ish"):
-            labor_share = 0.80
-            manpower_reduction = 0.20
-            productivity_gain = 0.25
-            platform_cost = 600_000
+        st.button("Mall / Jewel-ish", on_click=_apply_preset, args=("Mall / Jewel-ish",))
     with col_p2:
-        if st.button("Precinct / JTC-ish"):
-            labor_share = 0.78
-            manpower_reduction = 0.18
-            productivity_gain = 0.25
-            platform_cost = 750_000
+        st.button("Precinct / JTC-ish", on_click=_apply_preset, args=("Precinct / JTC-ish",))
 
 # -------------------------------
-# Tabs
+# View selector
 # -------------------------------
-tab_calc, tab_sens, tab_theory, tab_about = st.tabs(
-    ["ROI Calculator", "Sensitivity", "Theory Map", "About"]
+# A radio instead of st.tabs: tabs execute every body on each rerun, whereas
+# here only the selected view runs.
+active_tab = st.radio(
+    "View",
+    ["ROI Calculator", "Sensitivity", "Theory Map", "About"],
+    horizontal=True,
+    key="active_tab",
+    label_visibility="collapsed"
 )
 
+# Streamlit drops a widget's state while it isn't drawn, so the Sensitivity
+# widgets are seeded from plain session_state keys that survive view switches
+_LEVERS = ["Manpower reduction (%)", "Productivity gain (%)"]
+st.session_state.setdefault("sens_lever", _LEVERS[0])
+st.session_state.setdefault("sens_steps", 15)
+
+
+def _remember(widget_key: str, store_key: str):
+    """Widget callback: copy the widget's value into a key that isn't cleaned up."""
+    st.session_state[store_key] = st.session_state[widget_key]
+
 # -------------------------------
 # ROI Calculator
 # -------------------------------
-with tab_calc:
+if active_tab == "ROI Calculator":
     st.subheader("Security+ ROI Sandbox")
     st.write("Explore how **manpower savings** and **productivity gains** turn into measurable ROI.")
 
     results = compute_roi(
         annual_ops_cost, labor_share, manpower_reduction, productivity_gain, platform_cost
     )
-    df = pd.DataFrame(
-        {
-            "Metric": [
-                "Baseline cost",
-                "New cost",
-                "Savings",
-                "Platform cost",
-                "ROI (Savings / Platform)",
-                "Payback (months)"
-            ],
-            "Value": [
-                results["Baseline cost"],
-                results["New cost"],
-                results["Savings"],
-                results["Platform cost"],
-                round(results["ROI (Savings / Platform)"], 2),
-                round(results["Payback (months)"], 1)
-            ]
-        }
-    )
+    table_data = results_table(tuple(results.items()))
 
     st.subheader("Results")
-    st.table(df)
+    st.dataframe(table_data, hide_index=True, width="stretch")
 
     c1, c2, c3 = st.columns(3)
-    c1.metric("Savings", format_money(results["Savings"]))
+    c1.metric("Savings", f"${results['Savings']:,.0f}")
     c2.metric("ROI (x)", f"{results['ROI (Savings / Platform)']:.2f}x")
     c3.metric("Payback", f"{results['Payback (months)']:.1f} months")
 
-    csv_df = pd.DataFrame([results])
     st.download_button(
         "Download results as CSV",
-        data=csv_df.to_csv(index=False).encode("utf-8"),
+        data=results_csv(tuple(results.items())),
         file_name="security_plus_roi_results.csv",
         mime="text/csv"
     )
@@ -199,78 +382,47 @@ with tab_calc:
 # -------------------------------
 # Sensitivity
 # -------------------------------
-with tab_sens:
+if active_tab == "Sensitivity":
     st.subheader("Sensitivity analysis")
     st.write("Sweep a lever to see how outcomes change while other inputs stay fixed.")
 
     opt = st.selectbox(
         "Choose lever to sweep",
-        ["Manpower reduction (%)", "Productivity gain (%)"]
+        _LEVERS,
+        index=_LEVERS.index(st.session_state.sens_lever),
+        key="sens_lever_widget",
+        on_change=_remember,
+        args=("sens_lever_widget", "sens_lever")
     )
 
-    steps = st.slider("Number of steps", 5, 30, 15)
+    steps = st.slider(
+        "Number of steps", 5, 30,
+        value=st.session_state.sens_steps,
+        key="sens_steps_widget",
+        on_change=_remember,
+        args=("sens_steps_widget", "sens_steps")
+    )
+    sweeps = all_sweeps(
+        annual_ops_cost, labor_share, manpower_reduction, productivity_gain, platform_cost, steps
+    )
+    st.line_chart(sweeps[opt])
 
     if opt == "Manpower reduction (%)":
-        xs = pd.Series([i / 100 for i in list(range(0, 41, max(1, int(40/(steps-1)))))], name="Manpower cut")
-        rows = []
-        for mcut in xs:
-            r = compute_roi(annual_ops_cost, labor_share, mcut, productivity_gain, platform_cost)
-            r["x"] = mcut
-            rows.append(r)
-        sens_df = pd.DataFrame(rows)
-        chart_df = sens_df[["x", "Savings", "ROI (Savings / Platform)", "Payback (months)"]].copy()
-        chart_df.rename(columns={"x": "Manpower cut"}, inplace=True)
-        st.line_chart(chart_df.set_index("Manpower cut"))
         st.caption("Higher manpower cuts on a high-labor-cost base typically improve ROI and reduce payback.")
     else:
-        xs = pd.Series([i / 100 for i in list(range(0, 41, max(1, int(40/(steps-1)))))], name="Productivity gain")
-        rows = []
-        for pg in xs:
-            r = compute_roi(annual_ops_cost, labor_share, manpower_reduction, pg, platform_cost)
-            r["x"] = pg
-            rows.append(r)
-        sens_df = pd.DataFrame(rows)
-        chart_df = sens_df[["x", "Savings", "ROI (Savings / Platform)", "Payback (months)"]].copy()
-        chart_df.rename(columns={"x": "Productivity gain"}, inplace=True)
-        st.line_chart(chart_df.set_index("Productivity gain"))
         st.caption("Productivity gains enhance economics even without deeper manpower cuts.")
 
 # -------------------------------
 # Theory Map (loads your markdown files)
 # -------------------------------
-with tab_theory:
-    st.subheader("Theory ↔ Case Mapping")
-
-    st.markdown("##### Value Proposition Map")
-    st.markdown(load_markdown("theory-to-case/value-proposition-map.md"))
-
-    st.markdown("---")
-    st.markdown("##### Strategic Challenges Map")
-    st.markdown(load_markdown("theory-to-case/strategic-challenges-map.md"))
-
-    st.markdown("---")
-    st.markdown("##### Frameworks Applied")
-    st.markdown(load_markdown("theory-to-case/frameworks.md"))
+if active_tab == "Theory Map":
+    _render_theory()
 
 # -------------------------------
 # About
 # -------------------------------
-with tab_about:
-    st.subheader("About this companion")
-
-    st.markdown("""
-**Course:** Technology & Digitization of Supply Chains  
-**School:** SP Jain School of Global Management  
-**Team:** Group 4 — Sanchit, Midhun, Venarose, Dhruv
-
-**What this app demonstrates**
-- We operationalize the case narrative into a quantitative sandbox.
-- We connect slide claims to academic frameworks and page-anchored evidence.
-- We make the value-proposition shift (from guard-hours to outcomes) measurable.
-""")
-
-    st.markdown("---")
-    st.write("If you have our deck or GitHub link, you can jump between slides, this app, and the theory files for full transparency.")
+if active_tab == "About":
+    _render_about()
 
 # -------------------------------
 # Matching footer (beige bar with red text)